@@ -7,10 +7,20 @@ then creates symbolic links organized by category.
 
 import os
 import sys
+import errno
+import ctypes
 import string
+import itertools
+import json
+import queue
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Set
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import argparse
 
 # File extensions by category
@@ -21,6 +31,19 @@ FILE_CATEGORIES = {
     'text': {'.txt', '.pdf', '.doc', '.docx', '.rtf', '.odt', '.md', '.epub', '.mobi'}
 }
 
+FILE_CATEGORIES = {category: frozenset(extensions) for category, extensions in FILE_CATEGORIES.items()}
+
+# Flattened extension -> category lookup, built once so each file needs a single dict hit
+EXT_TO_CATEGORY = {ext: category for category, extensions in FILE_CATEGORIES.items() for ext in extensions}
+
+# Category names by index, and extension -> index, for the compact scan results
+# (a flat list of paths plus a parallel array('B') of these indices)
+_CATEGORY_NAMES = tuple(FILE_CATEGORIES)
+_EXT_TO_INDEX = {ext: _CATEGORY_NAMES.index(category) for ext, category in EXT_TO_CATEGORY.items()}
+
+# Longest known extension (with its dot); longer ones can't match, so they skip lower()
+_MAX_EXT_LEN = max(len(ext) for ext in EXT_TO_CATEGORY)
+
 # Directories to exclude (case-insensitive)
 EXCLUDED_DIRS = {
     # Windows system directories
@@ -42,23 +65,202 @@ EXCLUDED_DIRS = {
     '.cache', '.config', '.vscode', '.idea'
 }
 
+# Lowercased copy of EXCLUDED_DIRS matched directly against DirEntry names
+EXCLUDED_DIRS_LOWER = frozenset(d.lower() for d in EXCLUDED_DIRS)
 
-def is_admin():
-    """Check if the script is running with administrator privileges."""
+# Whether stat results carry Windows file attributes, checked once at import
+_HAS_FILE_ATTRS = hasattr(os.stat_result, 'st_file_attributes')
+
+# FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM
+HIDDEN_OR_SYSTEM = 0x2 | 0x4
+
+# OpenProcessToken access right and GetTokenInformation class used by is_admin
+TOKEN_QUERY = 0x0008
+TOKEN_ELEVATION = 20
+
+# GetDriveTypeW results left out by --skip-removable
+DRIVE_REMOVABLE = 2
+DRIVE_CDROM = 5
+
+# CreateSymbolicLinkW flag that lets Developer Mode users create links without admin
+SYMBOLIC_LINK_FLAG_ALLOW_UNPRIVILEGED_CREATE = 0x2
+ERROR_INVALID_PARAMETER = 87
+
+# Values for --link-type, and how the summary names each kind
+LINK_TYPES = {'sym': 'Symbolic links', 'hard': 'Hard links', 'auto': 'Links'}
+
+# Hard link failures that make --link-type auto fall back to a symbolic link:
+# another volume (ERROR_NOT_SAME_DEVICE on Windows), or no hard link support
+_HARDLINK_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EINVAL,
+                                      errno.ENOTSUP, errno.EOPNOTSUPP})
+
+# Links are created by this many threads, fed through a queue holding at most
+# LINK_QUEUE_SIZE files; progress is reported every LINK_PROGRESS_INTERVAL links
+LINK_WORKERS = 16
+LINK_QUEUE_SIZE = 10000
+LINK_PROGRESS_INTERVAL = 1000
+
+# Set on junctions, symbolic links and other NTFS reparse points
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Progress is reported every PROGRESS_INTERVAL matches (a power of two, so
+# the check is a bitmask)
+PROGRESS_INTERVAL = 1024
+PROGRESS_MASK = PROGRESS_INTERVAL - 1
+
+# Result of is_admin, filled in on first call
+_IS_ADMIN_CACHE: Optional[bool] = None
+
+# On POSIX, each target folder is opened once and links are created relative
+# to that descriptor, so the folder's full path is only resolved once
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_CLOEXEC', 0)
+_LINK_DIR_FD = (hasattr(os, 'O_DIRECTORY') and os.symlink in os.supports_dir_fd
+                and os.link in os.supports_dir_fd)
+
+# Folders modified this recently before a scan are not cached: FAT and exFAT
+# store times in 2 second steps, so a later change could keep the same mtime
+CACHE_RACY_NS = 2 * 10**9
+
+# Default location of the scan cache database
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.media_finder_cache.sqlite3')
+
+# Directories with more subfolders than this share them with other scan workers
+SPLIT_THRESHOLD = 4
+
+# Directories whose matches the scan workers may get ahead of the consumer by
+SCAN_QUEUE_SIZE = 1024
+
+
+class BufferedLogger:
+    """
+    Collects output lines from any thread and writes them to stdout in batches.
+
+    Hot loops only append to a deque; a daemon thread writes everything queued
+    every flush_interval seconds. Once max_pending lines are waiting, log()
+    writes them itself, so producers faster than stdout are held back instead
+    of queueing without limit. Call flush() before printing directly so the
+    output stays in order.
+    """
+
+    def __init__(self, flush_interval: float = 0.1, max_pending: int = 4096):
+        self._lines = deque()
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+    def log(self, line: str):
+        """Queue a line for output."""
+        self._lines.append(line)
+        if self._thread is None:
+            self._start()
+        if len(self._lines) >= self._max_pending:
+            self.flush()
+
+    def flush(self):
+        """Write out every queued line now."""
+        with self._write_lock:
+            batch = []
+            try:
+                while True:
+                    batch.append(self._lines.popleft())
+            except IndexError:
+                pass
+            if not batch:
+                return
+
+            data = '\n'.join(batch) + '\n'
+            stream = sys.stdout
+            buffer = getattr(stream, 'buffer', None)
+            if buffer is None:
+                stream.write(data)
+                stream.flush()
+                return
+
+            # Anything print() left in the text layer has to go out first
+            stream.flush()
+            buffer.write(data.encode(stream.encoding or 'utf-8', errors='replace'))
+            buffer.flush()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self._flush_interval)
+            self.flush()
+
+
+# Shared writer for output produced inside the scan and link loops
+_logger = BufferedLogger()
+
+
+def _query_token_elevation() -> bool:
+    """Ask Windows whether this process token is elevated, False off Windows."""
     try:
-        import ctypes
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+        from ctypes import wintypes
+        advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    except (ImportError, AttributeError, OSError):
+        return False
+
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    advapi32.OpenProcessToken.argtypes = (wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE))
+    advapi32.GetTokenInformation.argtypes = (wintypes.HANDLE, ctypes.c_int, wintypes.LPVOID,
+                                             wintypes.DWORD, ctypes.POINTER(wintypes.DWORD))
+
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(kernel32.GetCurrentProcess(), TOKEN_QUERY, ctypes.byref(token)):
         return False
+    try:
+        elevation = wintypes.DWORD()
+        size = wintypes.DWORD()
+        if not advapi32.GetTokenInformation(token, TOKEN_ELEVATION, ctypes.byref(elevation),
+                                            ctypes.sizeof(elevation), ctypes.byref(size)):
+            return False
+        return bool(elevation.value)
+    finally:
+        kernel32.CloseHandle(token)
+
+
+def is_admin():
+    """
+    Check if the script is running with administrator privileges.
+
+    Reads the token elevation through advapi32 rather than shell32, which
+    is slow to load, and caches the answer for the life of the process.
+    """
+    global _IS_ADMIN_CACHE
+    if _IS_ADMIN_CACHE is None:
+        _IS_ADMIN_CACHE = _query_token_elevation()
+    return _IS_ADMIN_CACHE
 
 
-def get_all_drives():
-    """Get all available drive letters on Windows."""
-    drives = []
-    for letter in string.ascii_uppercase:
-        drive = f"{letter}:\\"
-        if os.path.exists(drive):
-            drives.append(drive)
+def get_all_drives(include_removable: bool = True):
+    """
+    Get all available drive letters on Windows.
+
+    Reads the GetLogicalDrives bitmask in one call rather than probing all 26
+    letters, which can stall for seconds on a disconnected network drive.
+
+    Args:
+        include_removable: If False, leave out removable and CD-ROM drives
+    """
+    try:
+        kernel32 = ctypes.windll.kernel32
+    except AttributeError:
+        # Not on Windows, fall back to probing each letter
+        return [f"{letter}:\\" for letter in string.ascii_uppercase if os.path.exists(f"{letter}:\\")]
+
+    mask = kernel32.GetLogicalDrives()
+    drives = [f"{letter}:\\" for i, letter in enumerate(string.ascii_uppercase) if mask & (1 << i)]
+    if not include_removable:
+        drives = [d for d in drives if kernel32.GetDriveTypeW(d) not in (DRIVE_REMOVABLE, DRIVE_CDROM)]
     return drives
 
 
@@ -66,225 +268,786 @@ def should_exclude_directory(path: Path) -> bool:
     """
     Check if a directory should be excluded from scanning.
 
+    Only the directory's own name is checked. The scan prunes excluded
+    folders top-down, so their descendants are never visited; use
+    is_excluded_root for starting points that may sit inside one.
+
     Args:
         path: Path object to check
 
     Returns:
         True if directory should be excluded, False otherwise
     """
-    # Check if it's a hidden folder (starts with .)
-    if path.name.startswith('.'):
-        return True
+    # Hidden folders (starting with .) and excluded names (case-insensitive)
+    return path.name.startswith('.') or path.name.lower() in EXCLUDED_DIRS_LOWER
 
-    # Check against excluded directories (case-insensitive)
-    path_lower = path.name.lower()
-    if path_lower in EXCLUDED_DIRS:
-        return True
 
-    # Check if any parent directory is in excluded list
-    try:
-        parts_lower = [p.lower() for p in path.parts]
-        for excluded in EXCLUDED_DIRS:
-            if excluded in parts_lower:
-                return True
-    except:
-        pass
+def is_excluded_root(path: Path) -> bool:
+    """
+    Check if a scan root is, or lies inside, an excluded directory.
 
-    return False
+    Args:
+        path: Directory the scan would start from
+
+    Returns:
+        True if any component of the absolute path is excluded, False otherwise
+    """
+    parts = Path(os.path.abspath(path)).parts
+    return any(should_exclude_directory(Path(part)) for part in parts[1:])
 
 
-def get_file_category(file_path: Path) -> str:
+def get_file_category(file_path) -> str:
     """
     Determine the category of a file based on its extension.
 
     Args:
-        file_path: Path to the file
+        file_path: Path or string name of the file
 
     Returns:
         Category name or None if file doesn't match any category
     """
-    extension = file_path.suffix.lower()
-    for category, extensions in FILE_CATEGORIES.items():
-        if extension in extensions:
-            return category
-    return None
+    return EXT_TO_CATEGORY.get(os.path.splitext(file_path)[1].lower())
+
+
+class _VisitedDirs:
+    """Thread-safe record of the directories already scanned, by (device, inode)."""
 
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
 
-def scan_for_files(drives: List[str], progress_callback=None) -> Dict[str, List[Path]]:
+    def add(self, key: Tuple[int, int]) -> bool:
+        """Record a directory, returning False if it was already scanned."""
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+
+class ScanCache:
     """
-    Scan specified drives for media and document files.
+    On-disk cache of directory listings, keyed by path and modification time.
+
+    Adding, removing or renaming a file updates its folder's mtime, so a
+    folder whose mtime is unchanged since the last run can be answered from
+    the cache instead of being listed again. Only the folder's own listing is
+    cached; its subfolders are still visited and checked the same way.
+    load() reads the rows under the roots being scanned, and save() writes
+    the new listings back and drops rows for folders no longer found there.
+
+    A folder changed again within its filesystem's timestamp resolution of
+    being listed would keep the same mtime, so folders modified less than
+    CACHE_RACY_NS before the scan started are listed but never cached.
+
+    Category indices are stored as raw bytes, so the cache is tied to the
+    current FILE_CATEGORIES and EXCLUDED_DIRS; it is cleared when they change.
+    """
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._listings = {}
+        self._hits = set()
+        self._updates = []
+        self._fresh_after_ns = int(time.time() * 1e9) - CACHE_RACY_NS
+
+        layout = json.dumps([[(c, sorted(FILE_CATEGORIES[c])) for c in _CATEGORY_NAMES],
+                             sorted(EXCLUDED_DIRS_LOWER)])
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS cache_layout (layout TEXT)')
+            if conn.execute('SELECT layout FROM cache_layout').fetchall() != [(layout,)]:
+                conn.execute('DROP TABLE IF EXISTS dir_cache')
+                conn.execute('DELETE FROM cache_layout')
+                conn.execute('INSERT INTO cache_layout VALUES (?)', (layout,))
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS dir_cache (dir_path TEXT PRIMARY KEY, mtime INTEGER, '
+                'child_files TEXT, categories BLOB, subdirs TEXT, skipped INTEGER)'
+            )
+        conn.close()
+
+    def load(self, roots: List[str]):
+        """
+        Read the cached rows for the given absolute scan roots and everything below them.
+
+        Also marks the start of the scan for the recently-modified check.
+        """
+        self._fresh_after_ns = int(time.time() * 1e9) - CACHE_RACY_NS
+
+        with sqlite3.connect(self._db_path) as conn:
+            for root in roots:
+                # Paths under the root are exactly those sorting in [prefix, upper)
+                prefix = root if root.endswith(os.sep) else root + os.sep
+                upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                rows = conn.execute(
+                    'SELECT * FROM dir_cache WHERE dir_path = ? OR (dir_path >= ? AND dir_path < ?)',
+                    (root, prefix, upper)
+                )
+                for dir_path, *row in rows:
+                    self._listings[dir_path] = tuple(row)
+        conn.close()
+
+    def lookup(self, dir_path: str, mtime_ns: int):
+        """
+        Get the cached listing of a folder if it hasn't changed since.
+
+        Returns:
+            Listing in the same shape _list_directory returns, or None on a miss
+        """
+        row = self._listings.get(dir_path)
+        if row is None or row[0] != mtime_ns:
+            return None
+        self._hits.add(dir_path)
+        return json.loads(row[1]), array('B', row[2]), json.loads(row[3]), row[4]
+
+    def store(self, dir_path: str, mtime_ns: int, listing):
+        """Queue a fresh folder listing to be written by save(). Safe from any thread."""
+        if mtime_ns >= self._fresh_after_ns:
+            return  # Too recent to trust its mtime, list it again next time
+        names, categories, subdirs, skipped = listing
+        self._updates.append((dir_path, mtime_ns, json.dumps(names), categories.tobytes(),
+                              json.dumps(subdirs), skipped))
+
+    def save(self):
+        """Write this run's listings to disk and drop loaded rows that went unused."""
+        updates, self._updates = self._updates, []
+        stored = {update[0] for update in updates}
+        stale = [dir_path for dir_path in self._listings if dir_path not in self._hits and dir_path not in stored]
+        self._hits = set()
+        if not updates and not stale:
+            return
+
+        with sqlite3.connect(self._db_path) as conn:
+            conn.executemany('DELETE FROM dir_cache WHERE dir_path = ?', ((dir_path,) for dir_path in stale))
+            conn.executemany('INSERT OR REPLACE INTO dir_cache VALUES (?, ?, ?, ?, ?, ?)', updates)
+        conn.close()
+        for dir_path in stale:
+            del self._listings[dir_path]
+        for dir_path, *row in updates:
+            self._listings[dir_path] = tuple(row)
+
+
+def _list_directory(path: str):
+    """
+    List one directory, keeping matching files and subfolders worth visiting.
+
+    Each DirEntry carries its type from the directory listing, so no extra
+    stat() call is needed to tell files from folders. Junctions and other
+    reparse points are left out, as are excluded and hidden folders.
 
     Args:
-        drives: List of drive letters to scan
-        progress_callback: Optional callback function for progress updates
+        path: Directory to list
 
     Returns:
-        Dictionary mapping categories to lists of file paths
+        Tuple of (matching file names, array('B') of their category indices,
+        subfolder names, skipped hidden/system file count)
     """
-    found_files = defaultdict(list)
-    scanned_count = 0
+    names = []
+    categories = array('B')
+    subdirs = []
     skipped_count = 0
 
-    print(f"\nScanning {len(drives)} drive(s)...")
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name.startswith('.') or name.lower() in EXCLUDED_DIRS_LOWER:
+                        continue
+                    # Junctions such as "All Users" lead back into trees
+                    # scanned elsewhere, or round in a cycle
+                    if (_HAS_FILE_ATTRS and
+                            entry.stat(follow_symlinks=False).st_file_attributes & FILE_ATTRIBUTE_REPARSE_POINT):
+                        continue
+                    subdirs.append(name)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+
+            # Categorize file
+            dot = name.rfind('.')
+            if dot < 0 or len(name) - dot > _MAX_EXT_LEN:
+                continue
+            index = _EXT_TO_INDEX.get(name[dot:].lower())
+            if index is not None:
+                # Skip hidden and system files. On Windows DirEntry.stat()
+                # is filled from the directory listing, so this costs no
+                # extra syscall, and only candidate files get this far.
+                # Elsewhere there are no attributes, so no stat() at all.
+                if _HAS_FILE_ATTRS:
+                    try:
+                        if entry.stat().st_file_attributes & HIDDEN_OR_SYSTEM:
+                            skipped_count += 1
+                            continue
+                    except OSError:
+                        pass
+
+                names.append(name)
+                categories.append(index)
+
+    return names, categories, subdirs, skipped_count
+
+
+def _scan_root(top: str, emit, submit=None, counter=None, progress_callback=None,
+               visited: Optional[_VisitedDirs] = None,
+               cache: Optional[ScanCache] = None,
+               skip_paths: frozenset = frozenset(),
+               stopped: Optional[threading.Event] = None):
+    """
+    Walk a directory tree with os.scandir, emitting matching files per directory.
+
+    Directories are visited iteratively from an explicit stack. Each
+    directory's matches are passed to ``emit`` as soon as it is listed, as a
+    list of path strings with a parallel array('B') of category indices into
+    _CATEGORY_NAMES, so nothing builds up here however large the tree is.
+    When a directory has more than SPLIT_THRESHOLD subfolders, the
+    extra ones are handed to ``submit`` so idle workers can scan them in
+    parallel. ``visited`` guarantees each directory is scanned once even if
+    it is reachable twice.
 
-    for drive in drives:
-        print(f"\n  Scanning drive: {drive}")
+    Args:
+        top: Directory to start from
+        emit: Callable taking (file paths, category indices, skipped
+            hidden/system file count), called once per directory with any of them
+        submit: Optional callable that schedules a subtree on another worker
+        counter: Shared itertools.count used to number matches across workers
+        progress_callback: Optional callback taking (count, category, file name),
+            called every PROGRESS_INTERVAL matches
+        visited: Optional shared record of directories already scanned
+        cache: Optional ScanCache answering unchanged directories
+        skip_paths: Normcased absolute directories not to descend into
+        stopped: Optional event that ends the walk at the next directory once set
+    """
+    stack = deque([top])
 
+    while stack:
+        if stopped is not None and stopped.is_set():
+            return
+        path = stack.pop()
         try:
-            for root, dirs, files in os.walk(drive):
-                # Convert to Path object
-                root_path = Path(root)
+            st = None
+            if visited is not None or cache is not None:
+                # os.stat reports the volume serial and file ID on Windows
+                st = os.stat(path)
+            if visited is not None and st.st_ino and not visited.add((st.st_dev, st.st_ino)):
+                continue
+
+            listing = cache.lookup(path, st.st_mtime_ns) if cache is not None else None
+            if listing is None:
+                listing = _list_directory(path)
+                if cache is not None:
+                    cache.store(path, st.st_mtime_ns, listing)
+        except OSError:
+            continue  # Unreadable directory, os.walk skipped these silently too
+
+        names, name_categories, subdir_names, skipped = listing
+        if names or skipped:
+            emit([os.path.join(path, name) for name in names], name_categories, skipped)
+        for name, index in zip(names, name_categories):
+            if progress_callback and counter is not None:
+                scanned_count = next(counter)
+                if not scanned_count & PROGRESS_MASK:
+                    progress_callback(scanned_count, _CATEGORY_NAMES[index], name)
+
+        # Share out wide directories, keep the rest on this worker's stack
+        subdirs = [os.path.join(path, name) for name in subdir_names]
+        if skip_paths:
+            subdirs = [d for d in subdirs if os.path.normcase(d) not in skip_paths]
+        if submit is not None and len(subdirs) > SPLIT_THRESHOLD:
+            for subdir in subdirs[SPLIT_THRESHOLD:]:
+                submit(subdir)
+            del subdirs[SPLIT_THRESHOLD:]
+        stack.extend(subdirs)
+
+
+def iter_found_files(drives: List[str], progress_callback=None,
+                     cache: Optional[ScanCache] = None,
+                     exclude_paths: Optional[List[str]] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Scan specified drives, yielding media and document files as they are found.
+
+    Each drive is walked on its own worker thread, and large subtrees are
+    split across the same pool. Directory listing releases the GIL, so the
+    drives are read concurrently instead of one after another. Workers put
+    each directory's matches on a queue of at most SCAN_QUEUE_SIZE entries,
+    so a consumer starts on them while the scan is still running, and a
+    consumer that falls behind holds the scan back instead of letting
+    results pile up.
 
-                # Filter out excluded directories
-                dirs[:] = [d for d in dirs if not should_exclude_directory(root_path / d)]
+    Args:
+        drives: List of drive letters to scan
+        progress_callback: Optional callback taking (count, category, file name),
+            called from the scan workers every PROGRESS_INTERVAL matches
+        cache: Optional ScanCache; unchanged directories are read from it and
+            the listings of the rest are saved back to it
+        exclude_paths: Optional directories to leave out along with everything
+            below them, such as the output category folders
+
+    Yields:
+        (category, file path) tuples
+    """
+    category_counts = [0] * len(_CATEGORY_NAMES)
+    skipped_count = 0
+    counter = itertools.count(1)
+    visited = _VisitedDirs()
+    skip_paths = frozenset(os.path.normcase(os.path.abspath(p)) for p in exclude_paths or ())
+    # Directory batches, then None once the last scan task has finished
+    results = queue.Queue(maxsize=SCAN_QUEUE_SIZE)
+    stopped = threading.Event()
+    running = 0
+    running_lock = threading.Lock()
 
-                # Check files in current directory
-                for file in files:
-                    file_path = root_path / file
+    print(f"\nScanning {len(drives)} drive(s)...")
 
-                    # Skip if it's a system file
-                    try:
-                        if file_path.stat().st_file_attributes & 0x4:  # FILE_ATTRIBUTE_SYSTEM
-                            skipped_count += 1
-                            continue
-                    except (AttributeError, OSError):
-                        pass  # stat().st_file_attributes not available on all systems
-
-                    # Categorize file
-                    category = get_file_category(file_path)
-                    if category:
-                        found_files[category].append(file_path)
-                        scanned_count += 1
-
-                        if progress_callback and scanned_count % 100 == 0:
-                            progress_callback(scanned_count, category, file_path)
-
-        except PermissionError:
-            print(f"    [Skipped: Permission denied]")
-            continue
-        except Exception as e:
-            print(f"    [Error: {str(e)}]")
-            continue
-
-    print(f"\n  Scan complete! Found {scanned_count} files across {len(found_files)} categories")
+    def put(item):
+        # Gives up once the consumer has gone, so no worker blocks on a full queue
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def emit(paths, categories, skipped):
+        put((paths, categories, skipped))
+
+    max_workers = max(1, min(len(drives) * 2, (os.cpu_count() or 1) * 4))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit(top):
+            nonlocal running
+            if stopped.is_set():
+                return
+            # Counted before it is started, so the count can't reach zero early
+            with running_lock:
+                running += 1
+            executor.submit(scan_task, top)
+
+        def scan_task(top):
+            nonlocal running
+            try:
+                _scan_root(top, emit, submit, counter, progress_callback,
+                           visited, cache, skip_paths, stopped)
+            except Exception as e:
+                _logger.log(f"    [Error: {str(e)}]")
+            with running_lock:
+                running -= 1
+                finished = not running
+            if finished:
+                put(None)
+
+        roots = []
+        for drive in drives:
+            _logger.log(f"\n  Scanning drive: {drive}")
+            if is_excluded_root(Path(drive)):
+                _logger.log("    [Skipped: Inside an excluded directory]")
+                continue
+            # Absolute roots keep cache keys and exclude_paths comparable
+            root = os.path.abspath(drive)
+            norm_root = os.path.normcase(root)
+            if any(norm_root == p or norm_root.startswith(p.rstrip(os.sep) + os.sep) for p in skip_paths):
+                _logger.log("    [Skipped: Inside an excluded path]")
+                continue
+            roots.append(root)
+
+        if cache is not None:
+            cache.load(roots)
+        # All roots are counted before any of them can finish
+        running = len(roots)
+        for root in roots:
+            executor.submit(scan_task, root)
+
+        try:
+            while roots:
+                item = results.get()
+                if item is None:
+                    break
+
+                paths, categories, skipped = item
+                skipped_count += skipped
+                for file_path, index in zip(paths, categories):
+                    category_counts[index] += 1
+                    yield _CATEGORY_NAMES[index], file_path
+        finally:
+            # Abandoned early or done: either way the workers stop at their next directory
+            stopped.set()
+
+    _logger.flush()
+    if cache is not None:
+        cache.save()
+
+    scanned_count = sum(category_counts)
+    found_categories = sum(1 for count in category_counts if count)
+    print(f"\n  Scan complete! Found {scanned_count} files across {found_categories} categories")
     if skipped_count > 0:
-        print(f"  Skipped {skipped_count} system files")
+        print(f"  Skipped {skipped_count} hidden/system files")
+
 
-    return dict(found_files)
+def scan_for_files(drives: List[str], progress_callback=None,
+                   cache: Optional[ScanCache] = None,
+                   exclude_paths: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """
+    Scan specified drives for media and document files.
 
+    Collects everything iter_found_files yields; see there for the arguments.
 
-def create_hybrid_structure(category: str, source_file: Path, base_output_dir: Path, dry_run: bool = False) -> Path:
+    Returns:
+        Dictionary mapping categories to lists of file paths
+    """
+    found_files = {category: [] for category in FILE_CATEGORIES}
+    for category, file_path in iter_found_files(drives, progress_callback, cache, exclude_paths):
+        found_files[category].append(file_path)
+
+    return {category: files for category, files in found_files.items() if files}
+
+
+def _load_create_symbolic_link():
+    """Bind kernel32.CreateSymbolicLinkW once, or return None off Windows."""
+    try:
+        from ctypes import wintypes
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    except (ImportError, AttributeError, OSError):
+        return None
+
+    func = kernel32.CreateSymbolicLinkW
+    func.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD)
+    func.restype = wintypes.BOOLEAN
+    return func
+
+
+_CreateSymbolicLinkW = _load_create_symbolic_link()
+_symlink_flags = SYMBOLIC_LINK_FLAG_ALLOW_UNPRIVILEGED_CREATE
+
+
+def _create_symlink(source: str, target: str, dir_fd: Optional[int] = None):
+    """
+    Create a file symbolic link, returning any error instead of raising it.
+
+    On Windows this calls CreateSymbolicLinkW directly, skipping the argument
+    handling and exception translation os.symlink does on every call.
+
+    Args:
+        source: Absolute path of the existing file
+        target: Path of the link to create, or its name inside dir_fd
+        dir_fd: Optional descriptor of the folder the link goes in (POSIX only)
+
+    Returns:
+        None on success, otherwise the OSError describing the failure
+    """
+    global _symlink_flags
+
+    if _CreateSymbolicLinkW is None:
+        try:
+            os.symlink(source, target, dir_fd=dir_fd)
+        except OSError as e:
+            return e
+        return None
+
+    if _CreateSymbolicLinkW(target, source, _symlink_flags):
+        return None
+
+    code = ctypes.get_last_error()
+    if code == ERROR_INVALID_PARAMETER and _symlink_flags:
+        # Windows versions before 10 (1703) reject the unprivileged flag
+        _symlink_flags = 0
+        return _create_symlink(source, target)
+    return ctypes.WinError(code)
+
+
+def create_hybrid_structure(category: str, source_file: str, base_output_dir: str, dry_run: bool = False,
+                            dir_names: Optional[Dict[str, Dict[str, int]]] = None) -> str:
     """
     Create a hybrid folder structure for organizing symbolic links.
 
+    Works on plain strings with os.path rather than pathlib, since this runs
+    once per found file.
+
     Args:
         category: File category (pictures, audio, video, text)
         source_file: Original file path
         base_output_dir: Base directory for output
         dry_run: If True, don't actually create directories
+        dir_names: Optional cache mapping each target folder seen so far to the
+            names taken in it (and the next number to try for each), so folders
+            are created and listed once per run
 
     Returns:
         Target path for the symbolic link
     """
     # Get the parent directory name of the source file
     # This creates a subfolder structure like: pictures/Documents/photo.jpg
-    try:
-        # Get a meaningful parent folder name
-        parent_name = source_file.parent.name
-        if not parent_name or parent_name == '\\' or parent_name == '/':
-            parent_name = source_file.drive.replace(':', '').replace('\\', '')
-    except:
-        parent_name = 'root'
+    source_dir, name = os.path.split(source_file)
+    parent_name = os.path.basename(source_dir)
+    if not parent_name:
+        # File sits in a drive root, name the folder after the drive
+        parent_name = os.path.splitdrive(source_file)[0].replace(':', '').replace('\\', '')
 
     # Create category/parent structure
-    target_dir = base_output_dir / category / parent_name
-    if not dry_run:
-        target_dir.mkdir(parents=True, exist_ok=True)
+    target_dir = os.path.join(base_output_dir, category, parent_name)
+    if dir_names is None:
+        dir_names = {}
+    names = dir_names.get(target_dir)
+    if names is None:
+        if not dry_run:
+            os.makedirs(target_dir, exist_ok=True)
+        # One listing per folder instead of an exists() check per candidate name.
+        # normcase matches the filesystem's case-insensitivity on Windows.
+        try:
+            names = dict.fromkeys((os.path.normcase(name) for name in os.listdir(target_dir)), 1)
+        except OSError:
+            names = {}
+        dir_names[target_dir] = names
+
+    # Handle duplicate filenames, resuming numbering where the last duplicate
+    # of this name stopped so N copies don't cost N^2 lookups
+    key = os.path.normcase(name)
+    counter = names.get(key)
+    if counter is not None:
+        stem, suffix = os.path.splitext(name)
+        while True:
+            name = f"{stem}_{counter}{suffix}"
+            counter += 1
+            if os.path.normcase(name) not in names:
+                break
+        names[key] = counter
+    names.setdefault(os.path.normcase(name), 1)
+
+    return os.path.join(target_dir, name)
+
+
+def _create_hardlink(source: str, target: str, dir_fd: Optional[int] = None):
+    """
+    Create a hard link, returning any error instead of raising it.
+
+    Args:
+        source: Absolute path of the existing file
+        target: Path of the link to create, or its name inside dir_fd
+        dir_fd: Optional descriptor of the folder the link goes in (POSIX only)
+
+    Returns:
+        None on success, otherwise the OSError describing the failure
+    """
+    try:
+        os.link(source, target, dst_dir_fd=dir_fd)
+    except OSError as e:
+        return e
+    return None
 
-    # Handle duplicate filenames
-    target_path = target_dir / source_file.name
-    counter = 1
-    while target_path.exists():
-        stem = source_file.stem
-        suffix = source_file.suffix
-        target_path = target_dir / f"{stem}_{counter}{suffix}"
-        counter += 1
 
-    return target_path
+def _create_link(source: str, target: str, dir_fd: Optional[int] = None, link_type: str = 'sym'):
+    """
+    Create a link of the requested type, returning any error instead of raising it.
 
+    In 'auto' mode a hard link is tried first; if it can't be made because
+    the file is on another volume or the filesystem has no hard links, a
+    symbolic link is made instead. Trying first saves a stat() of every
+    source file to compare devices.
 
-def create_symbolic_links(files_by_category: Dict[str, List[Path]],
-                         output_dir: Path,
-                         dry_run: bool = False) -> Dict[str, int]:
+    Returns:
+        None on success, otherwise the OSError describing the failure
     """
-    Create symbolic links for all found files.
+    if link_type == 'sym':
+        return _create_symlink(source, target, dir_fd)
+
+    error = _create_hardlink(source, target, dir_fd)
+    if error is None or link_type == 'hard' or error.errno not in _HARDLINK_FALLBACK_ERRNOS:
+        return error
+    return _create_symlink(source, target, dir_fd)
+
+
+def _link_worker(work: queue.Queue, dry_run: bool, link_type: str, counter) -> Tuple[int, int, int]:
+    """
+    Create links for (source, target) pairs taken from a queue until it yields None.
+
+    The folder descriptor of the last target is kept open, since files from
+    one source folder arrive together and all go into the same target folder.
 
     Args:
-        files_by_category: Dictionary mapping categories to file lists
-        output_dir: Base directory for symbolic links
+        work: Queue of (absolute source path, target path) tuples, ended by None
+        dry_run: If True, only report what would be linked
+        link_type: 'sym', 'hard' or 'auto', see link_found_files
+        counter: Shared itertools.count used to number created links across workers
+
+    Returns:
+        Tuple of (created count, skipped count, failed count)
+    """
+    created = 0
+    skipped = 0
+    failed = 0
+    open_dir = None
+    dir_fd = None
+
+    try:
+        while True:
+            item = work.get()
+            if item is None:
+                break
+            source, target = item
+
+            if dry_run:
+                _logger.log(f"    Would link: {source} -> {target}")
+                created += 1
+                continue
+
+            try:
+                if _LINK_DIR_FD:
+                    target_dir, name = os.path.split(target)
+                    if target_dir != open_dir:
+                        if dir_fd is not None:
+                            os.close(dir_fd)
+                            dir_fd = None
+                        open_dir = target_dir
+                        try:
+                            dir_fd = os.open(target_dir, _DIR_OPEN_FLAGS)
+                        except OSError:
+                            pass  # Fall back to full paths for this folder
+                    if dir_fd is not None:
+                        target = name
+
+                error = _create_link(source, target, dir_fd, link_type)
+            except Exception as e:
+                error = e
+
+            if error is None:
+                created += 1
+
+                # Progress indicator
+                created_count = next(counter)
+                if not created_count % LINK_PROGRESS_INTERVAL:
+                    _logger.log(f"    Created {created_count} links...")
+            elif isinstance(error, FileExistsError):
+                skipped += 1
+            else:
+                _logger.log(f"    Failed to link {os.path.basename(source)}: {str(error)}")
+                failed += 1
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return created, skipped, failed
+
+
+def link_found_files(found_files: Iterable[Tuple[str, str]],
+                     output_dir: Path,
+                     dry_run: bool = False,
+                     link_type: str = 'sym') -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Create symbolic links (or hard links) for files as they arrive.
+
+    This thread works out each target folder and name, so folders exist
+    before any link goes into them, then hands the pair to LINK_WORKERS
+    threads through a bounded queue. Fed from iter_found_files, links are
+    created while the scan is still running, and both queues hold back the
+    side that gets ahead. The per-folder name records used to number
+    duplicates still grow with the number of files linked.
+
+    Hard links need no admin rights or Developer Mode and skip the reparse
+    point lookup when opened, but only work within one volume. They also
+    make the "original" ambiguous: deleting the source leaves the linked copy
+    intact, and both names are the same file on disk.
+
+    Args:
+        found_files: Iterable of (category, file path) tuples
+        output_dir: Base directory for the links
         dry_run: If True, only simulate without creating actual links
+        link_type: 'sym' for symbolic links, 'hard' for hard links, or 'auto'
+            for hard links where possible and symbolic links elsewhere
 
     Returns:
-        Dictionary with statistics about created links
+        Tuple of (dictionary with statistics about created links,
+        dictionary mapping each category to the number of files found)
     """
     stats = {
         'created': 0,
         'failed': 0,
         'skipped': 0
     }
+    category_counts = dict.fromkeys(FILE_CATEGORIES, 0)
+
+    dir_names = {}
+    base_output_dir = os.fspath(output_dir)
+    work = queue.Queue(maxsize=LINK_QUEUE_SIZE)
+    counter = itertools.count(1)
 
     mode = "DRY RUN" if dry_run else "CREATING LINKS"
     print(f"\n{mode}: Organizing files into {output_dir}")
 
-    for category, files in files_by_category.items():
-        print(f"\n  [{category.upper()}] Processing {len(files)} files...")
+    with ThreadPoolExecutor(max_workers=LINK_WORKERS) as executor:
+        workers = [executor.submit(_link_worker, work, dry_run, link_type, counter)
+                   for _ in range(LINK_WORKERS)]
+        try:
+            for category, source_file in found_files:
+                category_counts[category] += 1
+                try:
+                    # Determine target path with hybrid structure
+                    target_path = create_hybrid_structure(category, source_file, base_output_dir, dry_run,
+                                                          dir_names)
+                except OSError as e:
+                    _logger.log(f"    Failed to link {os.path.basename(source_file)}: {str(e)}")
+                    stats['failed'] += 1
+                    continue
+                except Exception as e:
+                    _logger.log(f"    Unexpected error with {os.path.basename(source_file)}: {str(e)}")
+                    stats['failed'] += 1
+                    continue
+
+                work.put((os.path.abspath(source_file), target_path))
+        finally:
+            for _ in workers:
+                work.put(None)
+
+        for future in workers:
+            created, skipped, failed = future.result()
+            stats['created'] += created
+            stats['skipped'] += skipped
+            stats['failed'] += failed
+
+    _logger.flush()
+    return stats, category_counts
+
+
+def create_symbolic_links(files_by_category: Dict[str, List[str]],
+                         output_dir: Path,
+                         dry_run: bool = False,
+                         link_type: str = 'sym') -> Dict[str, int]:
+    """
+    Create symbolic links (or hard links) for already collected files.
 
-        for source_file in files:
-            try:
-                # Determine target path with hybrid structure
-                target_path = create_hybrid_structure(category, source_file, output_dir, dry_run)
-
-                if dry_run:
-                    print(f"    Would link: {source_file} -> {target_path}")
-                    stats['created'] += 1
-                else:
-                    # Create symbolic link
-                    os.symlink(source_file, target_path)
-                    stats['created'] += 1
-
-                    # Progress indicator
-                    if stats['created'] % 50 == 0:
-                        print(f"    Created {stats['created']} links...")
-
-            except FileExistsError:
-                stats['skipped'] += 1
-            except OSError as e:
-                print(f"    Failed to link {source_file.name}: {str(e)}")
-                stats['failed'] += 1
-            except Exception as e:
-                print(f"    Unexpected error with {source_file.name}: {str(e)}")
-                stats['failed'] += 1
+    Args:
+        files_by_category: Dictionary mapping categories to file lists
+        output_dir: Base directory for symbolic links
+        dry_run: If True, only simulate without creating actual links
+        link_type: 'sym', 'hard' or 'auto', see link_found_files
 
+    Returns:
+        Dictionary with statistics about created links
+    """
+    found_files = ((category, source_file)
+                   for category, files in files_by_category.items() for source_file in files)
+    stats, _ = link_found_files(found_files, output_dir, dry_run, link_type)
     return stats
 
 
-def print_summary(files_by_category: Dict[str, List[Path]], stats: Dict[str, int], dry_run: bool):
-    """Print a summary of the operation."""
+def print_summary(category_counts: Dict[str, int], stats: Dict[str, int], dry_run: bool,
+                  link_type: str = 'sym'):
+    """Print a summary of the operation, given the number of files found per category."""
     print("\n" + "="*70)
     print("SUMMARY")
     print("="*70)
 
     print("\nFiles found by category:")
-    for category, files in sorted(files_by_category.items()):
-        print(f"  {category.capitalize()}: {len(files)} files")
+    for category, count in sorted(category_counts.items()):
+        if count:
+            print(f"  {category.capitalize()}: {count} files")
 
-    print(f"\nTotal files found: {sum(len(files) for files in files_by_category.values())}")
+    print(f"\nTotal files found: {sum(category_counts.values())}")
 
     if dry_run:
         print(f"\nDRY RUN complete - no actual links were created")
         print(f"  Would create: {stats['created']} links")
     else:
-        print(f"\nSymbolic links created: {stats['created']}")
+        print(f"\n{LINK_TYPES[link_type]} created: {stats['created']}")
 
     if stats['failed'] > 0:
         print(f"Failed: {stats['failed']}")
@@ -327,6 +1090,33 @@ Examples:
         help='Specific drives to scan (e.g., C: D:), default: all drives'
     )
 
+    parser.add_argument(
+        '--skip-removable',
+        action='store_true',
+        help='When scanning all drives, skip removable and CD-ROM drives'
+    )
+
+    parser.add_argument(
+        '--link-type',
+        choices=sorted(LINK_TYPES),
+        default='sym',
+        help="Link kind: 'sym' symbolic links (default), 'hard' hard links (same volume only, "
+             "no admin needed), 'auto' hard links where possible, symbolic links otherwise"
+    )
+
+    parser.add_argument(
+        '--cache-file',
+        type=str,
+        default=DEFAULT_CACHE_FILE,
+        help=f'Scan cache used to skip unchanged folders (default: {DEFAULT_CACHE_FILE})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Scan every folder without reading or updating the scan cache'
+    )
+
     args = parser.parse_args()
 
     # Print header
@@ -334,8 +1124,8 @@ Examples:
     print("MEDIA & DOCUMENT ORGANIZER")
     print("="*70)
 
-    # Check for admin privileges
-    if not is_admin():
+    # Check for admin privileges, hard links don't need them
+    if args.link_type != 'hard' and not is_admin():
         print("\nWARNING: Not running as administrator!")
         print("Symbolic link creation may fail on some Windows versions.")
         print("Consider running this script as administrator.\n")
@@ -348,7 +1138,7 @@ Examples:
     if args.drives:
         drives = [d if d.endswith(':\\') else f"{d}:\\" for d in args.drives]
     else:
-        drives = get_all_drives()
+        drives = get_all_drives(include_removable=not args.skip_removable)
 
     print(f"\nDrives to scan: {', '.join(drives)}")
 
@@ -357,28 +1147,43 @@ Examples:
     print(f"Output directory: {output_dir}")
 
     if not args.dry_run:
-        print("\nThis will create symbolic links on your system.")
+        print(f"\nThis will create {LINK_TYPES[args.link_type].lower()} on your system.")
         response = input("Continue? (y/n): ")
         if response.lower() != 'y':
             print("Exiting...")
             sys.exit(0)
 
-    # Progress callback
-    def progress(count, category, file_path):
-        print(f"    Found {count} files... (last: {category}/{file_path.name})")
-
-    # Scan for files
-    files_by_category = scan_for_files(drives, progress_callback=progress)
+    # Open the scan cache
+    cache = None
+    if not args.no_cache:
+        try:
+            cache = ScanCache(args.cache_file)
+            print(f"Scan cache: {args.cache_file}")
+        except (sqlite3.Error, OSError) as e:
+            print(f"\nWARNING: Scan cache unavailable ({str(e)}), scanning without it")
+
+    # Progress callback, called from the scan workers
+    def progress(count, category, name):
+        _logger.log(f"    Found {count} files... (last: {category}/{name})")
+
+    # Scan for files and link them as they are found.
+    # Hard links look like ordinary files, keep the category folders holding
+    # them from being found again; the rest of the output folder is scanned
+    found_files = iter_found_files(drives, progress_callback=progress, cache=cache,
+                                   exclude_paths=[str(output_dir / category) for category in FILE_CATEGORIES])
+    try:
+        stats, category_counts = link_found_files(found_files, output_dir, dry_run=args.dry_run,
+                                                  link_type=args.link_type)
+    finally:
+        # Stops the scan workers right away if linking is interrupted
+        found_files.close()
 
-    if not files_by_category:
+    if not any(category_counts.values()):
         print("\nNo files found matching the specified categories.")
         sys.exit(0)
 
-    # Create symbolic links
-    stats = create_symbolic_links(files_by_category, output_dir, dry_run=args.dry_run)
-
     # Print summary
-    print_summary(files_by_category, stats, args.dry_run)
+    print_summary(category_counts, stats, args.dry_run, args.link_type)
 
     if args.dry_run:
         print("\nTo create the symbolic links for real, run without --dry-run flag")
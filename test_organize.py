@@ -3,6 +3,9 @@
 Quick test script to verify organize_files.py functions work correctly
 """
 
+import os
+import sqlite3
+import tempfile
 from pathlib import Path
 import organize_files
 
@@ -33,7 +36,7 @@ def test_directory_exclusion():
     print("Testing directory exclusion...")
 
     test_cases = [
-        (Path('C:/Windows/System32'), True),
+        (Path('C:/Windows'), True),
         (Path('C:/Program Files'), True),
         (Path('C:/Users/Abe/.cache'), True),
         (Path('C:/Users/Abe/node_modules'), True),
@@ -47,9 +50,199 @@ def test_directory_exclusion():
         print(f"  {status} {path} -> excluded={is_excluded} (expected: {should_exclude})")
         assert is_excluded == should_exclude, f"Failed for {path}"
 
+    # Ancestors are only checked for scan roots
+    assert not organize_files.should_exclude_directory(Path('C:/Windows/System32'))
+    assert organize_files.is_excluded_root(Path('C:/Windows/System32'))
+    assert not organize_files.is_excluded_root(Path('C:/Users/Abe/Documents'))
+
     print("  All exclusion tests passed!\n")
 
 
+def test_scan_for_files():
+    """Test that scanning finds categorized files and prunes excluded folders."""
+    print("Testing file scanning...")
+
+    # The system temp folder is itself excluded, so work next to this file
+    with tempfile.TemporaryDirectory(dir=Path(__file__).parent) as tmp:
+        root = Path(tmp)
+        for rel in ['Pictures/photo.jpg', 'Music/song.mp3', 'Music/notes.xyz',
+                    'node_modules/pkg/readme.md', '.cache/thumb.png']:
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_text('x')
+
+        found = organize_files.scan_for_files([tmp])
+        print(f"  Found: {found}")
+        assert found == {
+            'pictures': [str(root / 'Pictures' / 'photo.jpg')],
+            'audio': [str(root / 'Music' / 'song.mp3')],
+        }, "Unexpected scan result"
+
+        # Overlapping roots are only scanned once
+        found = organize_files.scan_for_files([tmp, str(root / 'Music'), tmp])
+        assert sum(len(files) for files in found.values()) == 2, "Directories scanned twice"
+
+    print("  File scanning passed!\n")
+
+
+def test_scan_streaming():
+    """Test that matches are yielded while the scan is still running."""
+    print("Testing scan streaming...")
+
+    listed = []
+    list_directory = organize_files._list_directory
+    queue_size = organize_files.SCAN_QUEUE_SIZE
+
+    def counting_list_directory(path):
+        listed.append(path)
+        return list_directory(path)
+
+    with tempfile.TemporaryDirectory(dir=Path(__file__).parent) as tmp:
+        # A wide folder is split across tasks, a deep, narrow tree is not
+        for index in range(10):
+            (Path(tmp) / 'wide' / f'album{index}').mkdir(parents=True)
+            (Path(tmp) / 'wide' / f'album{index}' / 'song.mp3').write_text('x')
+        folder = Path(tmp)
+        for depth in range(50):
+            folder = folder / f'level{depth}'
+            folder.mkdir()
+            (folder / 'song.mp3').write_text('x')
+
+        organize_files._list_directory = counting_list_directory
+        organize_files.SCAN_QUEUE_SIZE = 1
+        try:
+            found = organize_files.iter_found_files([tmp])
+            next(found)
+            listed_at_first = len(listed)
+            rest = list(found)
+
+            # Closing the generator early stops the walk instead of finishing it
+            total = len(listed)
+            listed.clear()
+            found = organize_files.iter_found_files([tmp])
+            next(found)
+            found.close()
+            listed_at_close = len(listed)
+        finally:
+            organize_files._list_directory = list_directory
+            organize_files.SCAN_QUEUE_SIZE = queue_size
+
+        print(f"  Directories listed at first match: {listed_at_first} of {total}")
+        assert listed_at_first < total, "First match only arrived after the scan finished"
+        assert len(rest) == 59, f"Expected 59 more matches, got {len(rest)}"
+        print(f"  Directories listed after closing early: {listed_at_close} of {total}")
+        assert listed_at_close < total, "Closing the generator did not stop the scan"
+
+    print("  Scan streaming passed!\n")
+
+
+def test_scan_cache():
+    """Test that unchanged folders are answered from the scan cache."""
+    print("Testing scan cache...")
+
+    with tempfile.TemporaryDirectory(dir=Path(__file__).parent) as tmp:
+        root = Path(tmp)
+        music = root / 'Music'
+        old = music / 'Old'
+        old.mkdir(parents=True)
+        (music / 'song.mp3').write_text('x')
+        cache_file = str(root / '.cache.sqlite3')
+
+        # A folder modified just now is too recent to be cached
+        organize_files.scan_for_files([str(music)], cache=organize_files.ScanCache(cache_file))
+        (music / 'song.mp3').unlink()
+        (music / 'song.mp3').write_text('x')
+        mtime_ns = music.stat().st_mtime_ns
+        recent = organize_files.scan_for_files([str(music)], cache=organize_files.ScanCache(cache_file))
+        assert recent == {'audio': [str(music / 'song.mp3')]}, "Recently modified folder was cached"
+
+        # Age the folders so they are cached
+        mtime_ns -= 60 * 10**9
+        for folder in (music, old):
+            os.utime(folder, ns=(mtime_ns, mtime_ns))
+        first = organize_files.scan_for_files([str(music)], cache=organize_files.ScanCache(cache_file))
+
+        # Remove the file but keep the folder's mtime, so only the cache knows it
+        (music / 'song.mp3').unlink()
+        os.utime(music, ns=(mtime_ns, mtime_ns))
+        cached = organize_files.scan_for_files([str(music)], cache=organize_files.ScanCache(cache_file))
+        assert cached == first, "Unchanged folder was not read from the cache"
+
+        # A real change bumps the mtime and invalidates the entry
+        (music / 'other.mp3').write_text('x')
+        old.rmdir()
+        os.utime(music, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        fresh = organize_files.scan_for_files([str(music)], cache=organize_files.ScanCache(cache_file))
+        print(f"  Cached: {cached}, after change: {fresh}")
+        assert fresh == {'audio': [str(music / 'other.mp3')]}, "Changed folder was served from the cache"
+
+        # The removed folder's row is pruned, and other roots' rows are not loaded
+        with sqlite3.connect(cache_file) as conn:
+            rows = [row[0] for row in conn.execute('SELECT dir_path FROM dir_cache')]
+        conn.close()
+        assert rows == [str(music)], f"Unexpected cache rows: {rows}"
+        cache = organize_files.ScanCache(cache_file)
+        cache.load([str(old)])
+        assert cache.lookup(str(music), mtime_ns + 10**9) is None, "Row outside the roots was loaded"
+
+    print("  Scan cache passed!\n")
+
+
+def test_duplicate_names():
+    """Test that files sharing a name get numbered link names."""
+    print("Testing duplicate link names...")
+
+    with tempfile.TemporaryDirectory(dir=Path(__file__).parent) as tmp:
+        (Path(tmp) / 'pictures' / 'Photos').mkdir(parents=True)
+        (Path(tmp) / 'pictures' / 'Photos' / 'a.jpg').write_text('x')
+
+        dir_names = {}
+        targets = [
+            Path(organize_files.create_hybrid_structure(
+                'pictures', str(Path(drive) / 'Photos' / 'a.jpg'), tmp, dry_run=True, dir_names=dir_names
+            )).name
+            for drive in ('One', 'Two', 'Three')
+        ]
+        print(f"  Targets: {targets}")
+        assert targets == ['a_1.jpg', 'a_2.jpg', 'a_3.jpg'], "Unexpected duplicate names"
+
+    print("  Duplicate name handling passed!\n")
+
+
+def test_hard_links():
+    """Test hard link creation and that the output folder isn't rescanned."""
+    print("Testing hard links...")
+
+    with tempfile.TemporaryDirectory(dir=Path(__file__).parent) as tmp:
+        music = Path(tmp) / 'Music'
+        music.mkdir()
+        (music / 'song.mp3').write_text('x')
+        output_dir = Path(tmp) / 'organized'
+        exclude = [str(output_dir / category) for category in organize_files.FILE_CATEGORIES]
+
+        found = organize_files.scan_for_files([tmp], exclude_paths=exclude)
+        stats = organize_files.create_symbolic_links(found, output_dir, link_type='hard')
+        link = output_dir / 'audio' / 'Music' / 'song.mp3'
+        assert stats['created'] == 1 and not link.is_symlink(), "Hard link not created"
+        assert os.path.samefile(link, music / 'song.mp3'), "Link points at another file"
+
+        rescan = organize_files.scan_for_files([tmp], exclude_paths=exclude)
+        print(f"  Rescan: {rescan}")
+        assert rescan == found, "Output folder was scanned"
+
+        # Only the category folders are left out, other media in the output folder is found
+        (output_dir / 'photo.jpg').write_text('x')
+        rescan = organize_files.scan_for_files([tmp], exclude_paths=exclude)
+        assert rescan['pictures'] == [str(output_dir / 'photo.jpg')], "Media in the output folder was missed"
+
+        # Scanning the output folder itself still skips its category folders
+        rescan = organize_files.scan_for_files([str(output_dir)], exclude_paths=exclude)
+        assert rescan == {'pictures': [str(output_dir / 'photo.jpg')]}, "Links were found again from the output root"
+        rescan = organize_files.scan_for_files([str(output_dir / 'audio')], exclude_paths=exclude)
+        assert rescan == {}, "Excluded root was scanned"
+
+    print("  Hard links passed!\n")
+
+
 def test_drive_detection():
     """Test that drives can be detected."""
     print("Testing drive detection...")
@@ -79,6 +272,11 @@ if __name__ == '__main__':
     try:
         test_file_categorization()
         test_directory_exclusion()
+        test_scan_for_files()
+        test_scan_streaming()
+        test_scan_cache()
+        test_duplicate_names()
+        test_hard_links()
         test_drive_detection()
         test_admin_check()
 